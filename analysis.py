@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+from collections import deque
+from multiprocessing import Process, Queue, RawArray, cpu_count
+from threading import Thread
+import numpy as np
+import logging
+import traceback
+
+
+log = logging.getLogger(__name__)
+
+
+def analysis_worker(analyze, buffer, shape, tasks, results):
+    windows = np.ctypeslib.as_array(buffer).reshape(shape)
+    for slot, sequence in iter(tasks.get, None):
+        try:
+            results.put((slot, sequence, True, analyze(windows[slot])))
+        except:
+            traceback.print_exc()
+            results.put((slot, sequence, False, None))
+
+
+class AnalysisPool(object):
+    '''
+    Spreads the analysis of windows over worker processes, so it isn't pinned to one core by the GIL.
+
+    process() is a window callback: it copies the window into a free slot of a shared-memory buffer
+    and only sends the slot number to a worker, which calls analyze(window) and sends back the result
+    (so analyze must be a module-level function and its result should be small, e.g. a few features).
+    The results are put back into the order of the windows and passed to output(result),
+    or output(result, info) in timing mode, from a collector thread.
+    shape is the shape of a window. If every one of the slots (twice the number of workers
+    by default) is still being analyzed, the window is dropped and counted.
+    '''
+
+    def __init__(self, analyze, output, shape, workers=None, slots=None):
+        self.output = output
+        workers = workers or cpu_count()
+        slots = slots or 2 * workers
+        shape = (slots,) + tuple(shape)
+        buffer = RawArray('f', int(np.prod(shape)))
+        self.windows = np.ctypeslib.as_array(buffer).reshape(shape)
+        # slots are taken by process() and given back by the collector thread, deque is thread-safe
+        self.free = deque(range(slots))
+        self.tasks = Queue()
+        self.results = Queue()
+        self.infos = {}
+        self.finished = {}
+        self.next_sequence = 0
+        self.next_output = 0
+        self.dropped = 0
+        self.workers = [Process(target=analysis_worker, args=(analyze, buffer, shape, self.tasks, self.results))
+                        for i in range(workers)]
+        for worker in self.workers:
+            worker.daemon = True
+            worker.start()
+        self.collector = Thread(target=self.collect)
+        self.collector.daemon = True
+        self.collector.start()
+        log.debug('%d analysis workers started.' % workers)
+
+    def process(self, window, info=None):
+        try:
+            slot = self.free.popleft()
+        except IndexError:
+            self.dropped += 1
+            log.debug('Analysis workers too slow, window dropped.')
+            return
+        self.windows[slot] = window
+        self.infos[self.next_sequence] = info
+        self.tasks.put((slot, self.next_sequence))
+        self.next_sequence += 1
+
+    def collect(self):
+        for slot, sequence, ok, result in iter(self.results.get, None):
+            self.free.append(slot)
+            self.finished[sequence] = ok, result
+            # results arrive in any order, but the output must see them in the order of the windows
+            while self.next_output in self.finished:
+                ok, result = self.finished.pop(self.next_output)
+                info = self.infos.pop(self.next_output)
+                self.next_output += 1
+                if not ok:
+                    continue
+                try:
+                    if info is None:
+                        self.output(result)
+                    else:
+                        self.output(result, info)
+                except:
+                    traceback.print_exc()
+
+    def close(self):
+        ''' waits for the windows being analyzed and their output '''
+        for worker in self.workers:
+            self.tasks.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.results.put(None)
+        self.collector.join()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# asyncio front-end of PulseAudioMonitor, Python 3.6+ only
+
+from threading import Lock
+from concurrent.futures import CancelledError
+from pulse import PulseAudioMonitor
+import asyncio
+
+
+QUEUE_SIZE = 4  # windows waiting for the async consumer
+
+
+class AsyncMonitor(object):
+    '''
+    Lets an asyncio service iterate over the windows of a PulseAudioMonitor:
+
+        monitor = AsyncMonitor(config)
+        async for window in monitor.windows():
+            ...
+
+    config is the same as for PulseAudioMonitor, without the window callback (streams in
+    config['streams'] that bring their own one keep it). In timing mode, windows() yields
+    (window, info) tuples. The PulseAudio event loop runs in its own thread (see
+    PulseAudioMonitor.start()) and the consumer threads pass every window on to the event loop.
+
+    Backpressure: when the async consumer doesn't keep up, up to queue_size windows wait for it,
+    then the consumer threads wait as well and the stream queues drop windows according
+    to config['queue_policy']. Reading from PulseAudio never waits for the event loop.
+    '''
+
+    def __init__(self, config, queue_size=QUEUE_SIZE):
+        config = dict(config)
+        config['window_callback'] = self.window_callback
+        config.setdefault('suspended_callback', lambda: None)
+        self.monitor = PulseAudioMonitor(config)
+        self.queue_size = queue_size
+        self.queue = None
+        self.loop = None
+        # guards closed and pending, see window_callback() and close()
+        self.lock = Lock()
+        self.closed = True
+        self.pending = set()
+
+    def window_callback(self, window, info=None):
+        # called from the consumer threads, the window is only valid until this returns
+        item = window.copy() if info is None else (window.copy(), info)
+        with self.lock:
+            if self.closed:
+                return
+            future = asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop)
+            self.pending.add(future)
+        try:
+            future.result()
+        except CancelledError:
+            pass
+        finally:
+            with self.lock:
+                self.pending.discard(future)
+
+    async def windows(self):
+        '''
+        starts the monitor and yields its windows until the iteration ends,
+        which stops it again (only one iteration at a time)
+        '''
+        self.loop = asyncio.get_event_loop()
+        self.queue = asyncio.Queue(self.queue_size)
+        self.closed = False
+        self.monitor.start()
+        try:
+            while True:
+                yield await self.queue.get()
+        finally:
+            await self.close()
+
+    async def close(self):
+        with self.lock:
+            self.closed = True
+            # release the consumer threads waiting for room in the queue
+            for future in self.pending:
+                future.cancel()
+        # stop() joins the PulseAudio and consumer threads, don't block the event loop meanwhile
+        await self.loop.run_in_executor(None, self.monitor.stop)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# shared-memory window fan-out, Python 3.8+ only
+
+from multiprocessing import shared_memory
+from tap import HEADER_DTYPE, HEADER_SIZE, record_dtype
+from window import WindowInfo
+import numpy as np
+import time
+
+
+MAGIC = b'WPUB'
+POLL_INTERVAL = 0.002  # in seconds, see WindowSubscriber.windows()
+
+
+def published_dtype(channels, samples):
+    # sequence is -1 while the record is being written
+    return np.dtype([('sequence', '<i8')] + record_dtype(channels, samples).descr)
+
+
+class WindowPublisher(object):
+    '''
+    Publishes windows and their WindowInfo in a ring of slots windows in shared memory called name,
+    so other local processes can read them with a WindowSubscriber instead of opening
+    PulseAudio streams of their own.
+
+    The layout is the one of a WindowTap file, except that every record starts with its sequence
+    number (the count of windows published before it). The count in the header is updated after
+    the record, and a subscriber checks the sequence of a record before and after reading it,
+    so a record that is overwritten meanwhile isn't mistaken for the one it expected.
+    '''
+
+    def __init__(self, name, channels, samples, slots):
+        dtype = published_dtype(channels, samples)
+        self.memory = shared_memory.SharedMemory(name, create=True, size=HEADER_SIZE + slots * dtype.itemsize)
+        self.header = np.ndarray((1,), HEADER_DTYPE, self.memory.buf)[0]
+        self.header['magic'] = MAGIC
+        self.header['channels'] = channels
+        self.header['samples'] = samples
+        self.header['slots'] = slots
+        self.header['count'] = 0
+        self.records = np.ndarray((slots,), dtype, self.memory.buf, HEADER_SIZE)
+        self.records['sequence'] = -1
+        self.slots = slots
+        self.count = 0
+
+    def write(self, window, info):
+        record = self.records[self.count % self.slots]
+        record['sequence'] = -1
+        record['samples'] = window
+        record['index'] = info.index
+        record['capture_time'] = info.capture_time
+        record['latency'] = np.nan if info.latency is None else info.latency
+        record['stream_time'] = np.nan if info.stream_time is None else info.stream_time
+        record['sequence'] = self.count
+        self.count += 1
+        self.header['count'] = self.count
+
+    def close(self):
+        # the arrays must be gone before the memory can be closed
+        del self.records
+        del self.header
+        self.memory.close()
+        self.memory.unlink()
+
+
+class WindowSubscriber(object):
+    '''
+    Reads the windows a WindowPublisher publishes under name, without copying them.
+    windows() yields (sequence, window, info) for every window published after the subscriber
+    was created, window being a view into the shared memory. It is only overwritten once the
+    publisher has gone around the ring, valid(sequence) tells whether that has happened yet.
+    Windows that were overwritten before they could be read are counted as missed.
+    '''
+
+    def __init__(self, name):
+        try:
+            # don't let the resource tracker remove the publisher's memory when this process exits
+            self.memory = shared_memory.SharedMemory(name, track=False)
+        except TypeError:
+            # before Python 3.13
+            from multiprocessing import resource_tracker
+            self.memory = shared_memory.SharedMemory(name)
+            resource_tracker.unregister(self.memory._name, 'shared_memory')
+        self.header = np.ndarray((1,), HEADER_DTYPE, self.memory.buf)[0]
+        if self.header['magic'] != MAGIC:
+            raise ValueError('not a window publisher: %s' % name)
+        self.channels = int(self.header['channels'])
+        self.samples = int(self.header['samples'])
+        self.slots = int(self.header['slots'])
+        self.records = np.ndarray((self.slots,), published_dtype(self.channels, self.samples),
+                                  self.memory.buf, HEADER_SIZE)
+        self.next_sequence = int(self.header['count'])
+        self.missed = 0
+
+    def valid(self, sequence):
+        return int(self.records[sequence % self.slots]['sequence']) == sequence
+
+    def read(self):
+        ''' returns the next window as (sequence, window, info), or None if there is no new one yet '''
+        while self.next_sequence < int(self.header['count']):
+            sequence = self.next_sequence
+            self.next_sequence += 1
+            record = self.records[sequence % self.slots]
+            if int(record['sequence']) != sequence:
+                self.missed += 1
+                continue
+            latency = float(record['latency'])
+            stream_time = float(record['stream_time'])
+            info = WindowInfo(int(record['index']), float(record['capture_time']),
+                              None if np.isnan(latency) else latency,
+                              None if np.isnan(stream_time) else stream_time)
+            if not self.valid(sequence):
+                # overwritten while reading it
+                self.missed += 1
+                continue
+            return sequence, record['samples'], info
+        return None
+
+    def windows(self, poll_interval=POLL_INTERVAL):
+        ''' yields every new window, polling for them every poll_interval seconds '''
+        while True:
+            item = self.read()
+            if item is None:
+                time.sleep(poll_interval)
+                continue
+            yield item
+
+    def close(self):
+        del self.records
+        del self.header
+        self.memory.close()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+from window import WindowSource, unpack_s24
+import numpy as np
+import logging
+import os
+import struct
+import time
+
+
+SAMPLE_RATE = 44100  # in samples per second, for raw files
+BLOCK_WINDOWS = 4  # hops fed to the framer at once
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+WAVE_FORMAT_EXTENSIBLE = 0xfffe
+
+# (WAV format tag, bits per sample) -> NumPy dtype in the file, scale to [-1, 1)
+WAVE_SAMPLE_TYPES = {
+    (WAVE_FORMAT_PCM, 16): (np.dtype('<i2'), 1.0 / 2 ** 15),
+    (WAVE_FORMAT_PCM, 24): (np.dtype('u1'), 1.0 / 2 ** 31),  # see unpack_s24()
+    (WAVE_FORMAT_PCM, 32): (np.dtype('<i4'), 1.0 / 2 ** 31),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): (np.dtype('<f4'), None),
+}
+
+log = logging.getLogger(__name__)
+
+
+def read_wav_header(f):
+    '''
+    returns format tag, channels, sample rate, bits per sample,
+    and offset and size of the sample data of a RIFF WAVE file
+    '''
+    riff, size, wave = struct.unpack('<4sI4s', f.read(12))
+    if riff != b'RIFF' or wave != b'WAVE':
+        raise ValueError('not a WAV file')
+    fmt = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError('WAV file without data chunk')
+        chunk_id, chunk_size = struct.unpack('<4sI', header)
+        if chunk_id == b'fmt ':
+            chunk = f.read(chunk_size)
+            fmt = struct.unpack('<HHIIHH', chunk[:16])
+            if fmt[0] == WAVE_FORMAT_EXTENSIBLE:
+                # the actual format tag is at the start of the sub format GUID
+                fmt = struct.unpack('<H', chunk[24:26]) + fmt[1:]
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise ValueError('WAV file without fmt chunk')
+            format_tag, channels, rate, byte_rate, block_align, bits = fmt
+            return format_tag, channels, rate, bits, f.tell(), chunk_size
+        else:
+            f.seek(chunk_size, 1)
+        # chunks are padded to an even size
+        if chunk_size % 2:
+            f.seek(1, 1)
+
+
+class FileSource(WindowSource):
+    '''
+    Drop-in replacement for PulseAudioMonitor that reads a recording instead of a PulseAudio stream,
+    for benchmarks and regression tests.
+
+    Takes the same config as PulseAudioMonitor (samples_per_window, hop_size, window_callback,
+    suspended_callback, sample_rate_callback, timing) plus config['path'] of a WAV file
+    (16/24/32 bit PCM or 32 bit float) or a raw file of interleaved float32le samples
+    with config['channels'] and config['sample_rate'].
+    The file is memory-mapped, so only the pages that are actually read get loaded.
+    With config['realtime'] set, windows are delivered at the pace they were recorded,
+    otherwise as fast as the window callback allows. suspended_callback is called at the end
+    of the file, config['loop'] starts over instead.
+    '''
+
+    def __init__(self, config):
+        self.config = config
+        self.config.setdefault('hop_size', config['samples_per_window'])
+        path = config['path']
+        if path.endswith('.wav'):
+            with open(path, 'rb') as f:
+                format_tag, channels, self.sample_rate, bits, offset, size = read_wav_header(f)
+            if (format_tag, bits) not in WAVE_SAMPLE_TYPES:
+                raise ValueError('unsupported WAV format %d with %d bits per sample' % (format_tag, bits))
+            dtype, self.sample_scale = WAVE_SAMPLE_TYPES[(format_tag, bits)]
+            frame_size = channels * bits // 8
+            self.packed_s24 = bits == 24
+        else:
+            channels = config.get('channels', 1)
+            self.sample_rate = config.get('sample_rate', SAMPLE_RATE)
+            dtype, self.sample_scale = np.dtype('<f4'), None
+            offset = 0
+            frame_size = channels * dtype.itemsize
+            size = None
+            self.packed_s24 = False
+        if os.path.getsize(path) > offset:
+            data = np.memmap(path, dtype=np.uint8, mode='r', offset=offset)
+        else:
+            # np.memmap can't map an empty file
+            data = np.zeros(0, dtype=np.uint8)
+        if size is not None:
+            data = data[:size]
+        data = data[:len(data) - len(data) % frame_size]
+        # interleaved (frames, channels), except for packed 24 bit samples which are unpacked per block
+        self.frames = data if self.packed_s24 else data.view(dtype).reshape(-1, channels)
+        self.frame_size = frame_size
+        self.channels = channels
+        if 'sample_rate' in config and config['sample_rate'] != self.sample_rate:
+            log.warn('%s has a sample rate of %d Hz, not %d Hz.' % (path, self.sample_rate, config['sample_rate']))
+        WindowSource.__init__(self, config, channels, BLOCK_WINDOWS)
+
+    def __len__(self):
+        ''' number of frames in the file '''
+        return len(self.frames) // (self.frame_size if self.packed_s24 else 1)
+
+    def block(self, start, stop):
+        if not self.packed_s24:
+            return self.frames[start:stop]
+        return unpack_s24(self.frames[start * self.frame_size:stop * self.frame_size]).reshape(-1, self.channels)
+
+    def run(self):
+        ''' blocks until the end of the file has been reached (unless looping) or stop() has been called '''
+        self.should_stop = False
+        block_size = BLOCK_WINDOWS * self.config['hop_size']
+        speed = 1 if self.config.get('realtime') else None
+        if len(self) == 0:
+            # nothing to deliver, not even when looping
+            log.warn('%s holds no samples.' % self.config['path'])
+            self.config['suspended_callback']()
+            return
+        if self.config.get('sample_rate_callback'):
+            self.config['sample_rate_callback'](self.sample_rate)
+        start_time = time.time()
+        position = 0
+        while not self.should_stop:
+            if position >= len(self):
+                if not self.config.get('loop'):
+                    self.config['suspended_callback']()
+                    break
+                position = 0
+            self.framer.write(self.block(position, position + block_size), self.sample_scale)
+            position += block_size
+            self.deliver_windows(start_time, speed)
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 from canbus import CANCommander
-from visual import AudioVisualizer
+from visual import AudioVisualizer, analyze
+from analysis import AnalysisPool
 from pulse import PulseAudioMonitor
 import time
 import logging
@@ -9,12 +10,17 @@ import logging
 
 # IP and TCP port of CAN-Ethernet gateway
 ENDPOINT = ('10.43.100.112', 23)
+# worker processes for the window analysis, 0 to analyze in the consumer thread
+ANALYSIS_WORKERS = 0
+# peaks per second to show instead of analyzing the samples (see PulseAudioMonitor's meter mode), 0 for off
+METER_RATE = 0
 
 
 class Main(object):
     def __init__(self):
         self.monitor = None
         self.led_control = None
+        self.analysis = None
 
     def run(self):
         try:
@@ -40,18 +46,32 @@ class Main(object):
         logging.info('Initializing...')
         self.led_control = CANCommander(ENDPOINT)
         self.led_control.start()
-        visualizer = AudioVisualizer(self.led_control)
+        # peaks in meter mode, samples otherwise
+        window_size = 1 if METER_RATE else 1024
+        visualizer = AudioVisualizer(self.led_control, window_size)
+        window_callback = visualizer.process
+        if METER_RATE:
+            window_callback = visualizer.meter
+        elif ANALYSIS_WORKERS:
+            self.analysis = AnalysisPool(analyze, visualizer.show, (window_size,), ANALYSIS_WORKERS)
+            window_callback = self.analysis.process
         pulse_config = {
-            'sample_rate': 44100,  # currently duplicated in visual.py
-            'samples_per_window': 1024,
-            'window_callback': visualizer.process,
+            'samples_per_window': window_size,
+            'window_callback': window_callback,
+            'sample_rate_callback': visualizer.set_sample_rate,  # the sink's, or METER_RATE
             'suspended_callback': lambda: self.led_control.randomFading(100),
+            'threaded': True,  # keep the LED output off the PulseAudio thread
+            'idle_when_suspended': True,  # don't wake up at all while nothing plays
+            'meter_rate': METER_RATE,
         }
         self.monitor = PulseAudioMonitor(pulse_config)
         self.monitor.run()
 
     def _cleanup(self):
         logging.info('Cleaning up...')
+        if self.analysis is not None:
+            self.analysis.close()
+            self.analysis = None
         if self.led_control is not None:
             self.led_control.setMaster(0, led=0b1110)
             self.led_control.randomFading(100, led=1)
@@ -1,68 +1,611 @@
 #!/usr/bin/env python
 
 from signal import SIGINT, SIGTERM, SIGPIPE
+from threading import Thread, Event
 from pulseaudio import *
+# the functions are resolved on first access, so only the ones used here are imported
+from pulseaudio import (pa_channel_map_init_auto, pa_channel_map_parse, pa_channel_position_to_string,
+    pa_context_connect, pa_context_disconnect, pa_context_get_server_info, pa_context_get_sink_info_by_name,
+    pa_context_get_state, pa_context_is_local, pa_context_new, pa_context_set_state_callback,
+    pa_context_set_subscribe_callback, pa_context_subscribe, pa_context_unref, pa_mainloop_free,
+    pa_mainloop_get_api, pa_mainloop_new, pa_mainloop_run, pa_operation_unref, pa_proplist_free,
+    pa_proplist_from_string, pa_signal_done, pa_signal_init, pa_signal_new, pa_stream_connect_record,
+    pa_stream_cork, pa_stream_disconnect, pa_stream_drop, pa_stream_get_channel_map, pa_stream_get_device_name,
+    pa_stream_get_latency, pa_stream_get_state, pa_stream_get_time, pa_stream_is_suspended,
+    pa_stream_new_with_proplist, pa_stream_peek, pa_stream_set_moved_callback,
+    pa_stream_set_overflow_callback, pa_stream_set_read_callback, pa_stream_set_state_callback,
+    pa_stream_set_suspended_callback, pa_stream_unref, pa_threaded_mainloop_free,
+    pa_threaded_mainloop_get_api, pa_threaded_mainloop_lock, pa_threaded_mainloop_new,
+    pa_threaded_mainloop_start, pa_threaded_mainloop_stop, pa_threaded_mainloop_unlock)
 import ctypes as c
 import numpy as np
 import logging
+import os
+import random
+import signal
 import time
 import traceback
+from window import WindowFramer, WindowInfo, WindowQueue, unpack_s24
+from tap import WindowTap
 
 
 CONTEXT_NAME = 'LED Control'
 STREAM_NAME = 'LED Control Sensor'
-SAMPLE_RATE = 44100  # in samples per second
+MAX_PENDING_WINDOWS = 8  # older windows are dropped when the consumer falls further behind
+STATS_INTERVAL = 10  # in seconds
+RETRY_DELAY_MIN = 0.5  # in seconds, doubled after every failure
+RETRY_DELAY_MAX = 30.0  # in seconds
+QUEUE_SIZE = 8  # windows waiting for the consumer thread of a stream in threaded mode
+MAX_CALLBACK_ERRORS = 10  # consecutive window callback failures before giving up in threaded mode
+TAP_WINDOWS = 2600  # windows kept by a tap, about a minute with the default window size
+# tap files and shared memory names that must differ between streams, see PulseAudioMonitor
+PER_STREAM_KEYS = ('tap', 'publish')
+PUBLISH_WINDOWS = 64  # windows kept in shared memory for subscribers
+
+# config['sample_format'] -> PulseAudio format, NumPy dtype of a fragment, bytes per sample, scale to [-1, 1)
+SAMPLE_FORMATS = {
+    'float32le': (PA_SAMPLE_FLOAT32LE, np.dtype('<f4'), 4, None),
+    's16le': (PA_SAMPLE_S16LE, np.dtype('<i2'), 2, 1.0 / 2 ** 15),
+    's24le': (PA_SAMPLE_S24LE, np.dtype('u1'), 3, 1.0 / 2 ** 31),  # see unpack_s24()
+    's32le': (PA_SAMPLE_S32LE, np.dtype('<i4'), 4, 1.0 / 2 ** 31),
+}
 
 log = logging.getLogger(__name__)
 
+try:
+    # Python 3
+    _memory_buffer = c.pythonapi.PyMemoryView_FromMemory
+    _memory_buffer.argtypes = [c.c_void_p, c.c_ssize_t, c.c_int]
+    _memory_buffer.restype = c.py_object
+    _PyBUF_READ = 0x100
+    memory_buffer = lambda address, size: _memory_buffer(address, size, _PyBUF_READ)
+except AttributeError:
+    # Python 2
+    memory_buffer = c.pythonapi.PyBuffer_FromMemory
+    memory_buffer.argtypes = [c.c_void_p, c.c_ssize_t]
+    memory_buffer.restype = c.py_object
+
+
+def c_string(s):
+    ''' ctypes only takes bytes for a char * on Python 3 '''
+    return s.encode('utf-8') if isinstance(s, type(u'')) else s
+
+
+def py_string(s):
+    ''' and returns bytes for one '''
+    return s.decode('utf-8') if isinstance(s, bytes) and bytes is not str else s
+
+
+def stream_name(config):
+    return config.get('name') or config.get('sink') or 'default'
+
+
+def fragment_view(address, size, dtype=np.float32):
+    '''
+    Wraps a fragment returned by pa_stream_peek() as a read-only array without copying it.
+    The array points into PulseAudio's memory block and becomes invalid with the next
+    pa_stream_drop(), so it must be copied (e.g. into the sample ring) before that.
+    '''
+    return np.frombuffer(memory_buffer(address, size), dtype=dtype)
+
+
+class MonitorStream(object):
+    '''
+    One record stream of a PulseAudioMonitor with its own framing state and callbacks.
+    config holds the per-stream keys described in PulseAudioMonitor, config['sink'] names the
+    sink whose monitor source is recorded (None for the default sink).
+    With config['tap'] set to a path, every window and its WindowInfo is recorded there,
+    see WindowTap (config['tap_windows'] sets how many are kept, the tap of the previous run
+    is kept as path + '.1').
+    With config['publish'] set to a name, every window is published in shared memory of that name
+    for other processes, see WindowPublisher in fanout.py (Python 3.8+, config['publish_windows']
+    sets how many are kept).
+    In threaded mode, windows are handed to the stream's own consumer thread through a WindowQueue
+    of config['queue_size'] windows, config['queue_policy'] decides which ones are dropped when it is full.
+    With config['idle_when_suspended'] set, the stream is corked while the sink is suspended, so nothing
+    wakes up the process until it resumes, and uncorked again without having to reconnect.
+    With config['batch'] set, all windows that are complete after reading are delivered in a single call,
+    as one (windows, samples) or (windows, channels, samples) array, so a vectorized window callback
+    can catch up after a hiccup in one go. The WindowInfo (in timing mode) describes the first one.
+    The windows overlap in memory, so the array is read-only, copy it before changing it in place.
+    With config['meter_rate'] set (e.g. 100), the stream is in meter mode: PulseAudio sends the peak
+    of every 1 / meter_rate seconds instead of the samples, so the windows hold peak values
+    (samples_per_window is usually 1 then) and cost next to nothing to transfer and analyze.
+    A stream that follows the default sink switches over when it changes: the new stream is
+    connected first and the old one is only torn down once the new one is ready.
+    After the connection to the server is lost, reconnect() records the monitor source that was
+    recorded last right away, follow() then switches over if the sink has changed meanwhile.
+    '''
+
+    def __init__(self, monitor, config):
+        self.monitor = monitor
+        self.config = config
+        self.config.setdefault('sink', None)
+        self.config.setdefault('hop_size', config['samples_per_window'])
+        self.config.setdefault('channels', 1)
+        self.config.setdefault('sample_format', 'float32le')
+        self.name = stream_name(config)
+        self.stream = None
+        self.sink_name = None
+        # the stream being connected to the new default sink, see follow()
+        self.next_stream = None
+        self.next_sink_name = None
+        self.querying = False
+        # (sink name, monitor source name, sample rate) of the last stream that got ready
+        self.last_source = None
+        self.corked = False
+        # the server dropped data:
+        self.overflows = 0
+        self.holes = 0
+        if config['sample_format'] not in SAMPLE_FORMATS:
+            raise ValueError('unsupported sample format: %s' % config['sample_format'])
+        self.pa_format, self.fragment_dtype, sample_size, self.sample_scale = SAMPLE_FORMATS[config['sample_format']]
+        self.meter_rate = config.get('meter_rate')
+        if self.meter_rate and self.pa_format != PA_SAMPLE_FLOAT32LE:
+            raise ValueError('meter mode needs float32le samples')
+        # negotiated per stream, see stream_sample_rate()
+        self.sample_rate = None
+        self.next_sample_rate = None
+        self.frame_size = config['channels'] * sample_size
+        self.config['bytes_per_hop'] = config['hop_size'] * self.frame_size
+        # windows dropped because the consumer is too slow are counted by the framer
+        self.framer = WindowFramer(config['samples_per_window'], config['hop_size'],
+                                   config.get('max_pending_windows', MAX_PENDING_WINDOWS), config['channels'])
+        self.channel_map = pa_channel_map()
+        if 'channel_map' in config:
+            if not pa_channel_map_parse(self.channel_map, c_string(config['channel_map'])) or self.channel_map.channels != config['channels']:
+                raise ValueError('invalid channel map for %d channels: %s' % (config['channels'], config['channel_map']))
+        else:
+            pa_channel_map_init_auto(self.channel_map, config['channels'], PA_CHANNEL_MAP_DEFAULT)
+        self.channel_positions = None
+        self.queue = None
+        self.consumer = None
+        self.callback_errors = 0
+        # get every window along with its WindowInfo, see record()
+        self.recorders = []
+        if config.get('tap'):
+            self.recorders.append(WindowTap(config['tap'], config['channels'], config['samples_per_window'],
+                                            config.get('tap_windows', TAP_WINDOWS)))
+        if config.get('publish'):
+            # shared_memory is Python 3.8+
+            from fanout import WindowPublisher
+            self.recorders.append(WindowPublisher(config['publish'], config['channels'], config['samples_per_window'],
+                                                  config.get('publish_windows', PUBLISH_WINDOWS)))
+
+        # keep references to callback casts to prevent them from being garbage collected
+        self.c_sink_info_cb = pa_sink_info_cb_t(self.sink_info_cb)
+        self.c_state_cb = pa_stream_notify_cb_t(self.state_cb)
+        self.c_suspended_cb = pa_stream_notify_cb_t(self.suspended_cb)
+        self.c_moved_cb = pa_stream_notify_cb_t(self.moved_cb)
+        self.c_overflow_cb = pa_stream_notify_cb_t(self.overflow_cb)
+        self.c_read_cb = pa_stream_request_cb_t(self.read_cb)
+
+        # reused by every pa_stream_peek() call
+        self.peek_data = c.c_void_p()
+        self.peek_bytes = c.c_size_t()
+        self.peek_args = (c.byref(self.peek_data), c.byref(self.peek_bytes))
+        # reused by every pa_stream_get_time() and pa_stream_get_latency() call
+        self.stream_usec = pa_usec_t()
+        self.latency_usec = pa_usec_t()
+        self.latency_negative = c.c_int()
+
+    def log(self, level, msg):
+        log.log(level, 'stream %s: %s' % (self.name, msg))
+
+    def follow(self, context, default_sink_name):
+        '''
+        starts the stream if it isn't running, or switches it over if the sink to record has changed
+        '''
+        sink_name = self.config['sink'] or default_sink_name
+        if self.querying or self.next_stream is not None:
+            return
+        if self.stream is not None and sink_name == self.sink_name:
+            return
+        # we can't just start the stream, we first need to query the name of the monitor source
+        self.querying = True
+        pa_operation_unref(pa_context_get_sink_info_by_name(context, c_string(sink_name), self.c_sink_info_cb, None))
+
+    def sink_info_cb(self, context, sink_info, eol, userdata):
+        if eol:
+            self.querying = False
+            return
+        # we got the monitor source name of the sink, connect to it
+        info = sink_info.contents
+        name = py_string(info.name)
+        # the monitor source runs at the sample rate of its sink
+        sample_rate = self.stream_sample_rate(info.sample_spec.rate)
+        stream = self.connect(context, py_string(info.monitor_source_name), sample_rate)
+        if self.stream is None:
+            self.stream, self.sink_name = stream, name
+            self.set_sample_rate(sample_rate)
+        else:
+            self.log(logging.INFO, 'Switching to "%s"...' % name)
+            self.next_stream, self.next_sink_name, self.next_sample_rate = stream, name, sample_rate
+
+    def reconnect(self, context):
+        '''
+        connects to the monitor source recorded last without asking the server first,
+        saving two round trips before recording again
+        '''
+        if self.last_source is None or self.stream is not None or self.next_stream is not None:
+            return
+        sink_name, source_name, sample_rate = self.last_source
+        self.log(logging.DEBUG, 'Reconnecting to "%s"...' % sink_name)
+        self.stream, self.sink_name = self.connect(context, source_name, sample_rate), sink_name
+        self.set_sample_rate(sample_rate)
+
+    def remember_source(self, stream):
+        self.last_source = (self.sink_name, py_string(pa_stream_get_device_name(stream)), self.sample_rate)
+
+    def stream_sample_rate(self, native_rate):
+        '''
+        returns the rate to record a source at that runs at native_rate: the rate itself, so the server
+        doesn't have to resample, or an integer fraction of it with config['decimation'] set (e.g. 2).
+        config['sample_rate'] forces a rate instead, meter mode always uses the meter rate.
+        '''
+        if self.meter_rate:
+            return self.meter_rate
+        if self.config.get('sample_rate'):
+            return self.config['sample_rate']
+        return native_rate // self.config.get('decimation', 1)
+
+    def set_sample_rate(self, sample_rate):
+        if sample_rate == self.sample_rate:
+            return
+        if self.sample_rate is None:
+            self.log(logging.INFO, 'Recording at %d Hz.' % sample_rate)
+        else:
+            self.log(logging.INFO, 'Sample rate changed from %d Hz to %d Hz.' % (self.sample_rate, sample_rate))
+            # a window must not mix samples of different rates
+            self.framer.clear()
+        self.sample_rate = sample_rate
+        if self.config.get('sample_rate_callback'):
+            self.config['sample_rate_callback'](sample_rate)
+
+    def connect(self, context, source_name, sample_rate):
+        # now that we know the name of the source we want to record, we can actually start the stream
+        channels = self.config['channels']
+        sample_spec = pa_sample_spec(format=self.pa_format, rate=sample_rate, channels=channels)
+        proplist = pa_proplist_from_string(c_string(PA_PROP_APPLICATION_ICON_NAME + '="python"'))
+        stream = pa_stream_new_with_proplist(context, c_string(STREAM_NAME), sample_spec, self.channel_map, proplist)
+        pa_proplist_free(proplist)
+        pa_stream_set_state_callback(stream, self.c_state_cb, None)
+        pa_stream_set_suspended_callback(stream, self.c_suspended_cb, None)
+        pa_stream_set_moved_callback(stream, self.c_moved_cb, None)
+        pa_stream_set_overflow_callback(stream, self.c_overflow_cb, None)
+        pa_stream_set_read_callback(stream, self.c_read_cb, None)
+        buffer_attr = pa_buffer_attr(-1, -1, -1, -1, fragsize=self.config['bytes_per_hop'])
+        flags = PA_STREAM_ADJUST_LATENCY | PA_STREAM_DONT_INHIBIT_AUTO_SUSPEND
+        if self.config.get('timing'):
+            flags |= PA_STREAM_AUTO_TIMING_UPDATE | PA_STREAM_INTERPOLATE_TIMING
+        if self.meter_rate:
+            # the server resamples to meter_rate by taking the peaks
+            flags |= PA_STREAM_PEAK_DETECT
+        pa_stream_connect_record(stream, c_string(source_name), buffer_attr, flags)
+        return stream
+
+    def disconnect(self, stream):
+        pa_stream_disconnect(stream)
+        pa_stream_unref(stream)
+
+    def stop(self):
+        # a query in flight is cancelled along with its context, sink_info_cb won't see the end of it
+        self.querying = False
+        if self.next_stream is not None:
+            self.disconnect(self.next_stream)
+            self.next_stream = None
+        if self.stream is not None:
+            self.disconnect(self.stream)
+            self.stream = None
+            self.corked = False
+            self.framer.clear()
+
+    def start_consumer(self):
+        samples = self.config['samples_per_window']
+        shape = (samples,) if self.config['channels'] == 1 else (self.config['channels'], samples)
+        if self.config.get('batch'):
+            shape = (self.framer.max_pending,) + shape
+        self.queue = WindowQueue(self.config.get('queue_size', QUEUE_SIZE), shape,
+                                 self.config.get('queue_policy', 'drop-oldest'))
+        self.callback_errors = 0
+        self.consumer = Thread(target=self.consume_windows)
+        self.consumer.daemon = True
+        self.consumer.start()
+
+    def stop_consumer(self):
+        if self.consumer is None:
+            return
+        # the consumer finishes what is queued and exits
+        self.queue.close()
+        self.consumer.join()
+        self.consumer = None
+        self.queue = None
+
+    def consume_windows(self):
+        callback = self.config['window_callback']
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            window, info = item
+            try:
+                if info is None:
+                    callback(window)
+                else:
+                    callback(window, info)
+                self.callback_errors = 0
+            except:
+                traceback.print_exc()
+                # a single failure only costs a window, a callback that keeps failing stops everything
+                self.callback_errors += 1
+                if self.callback_errors == MAX_CALLBACK_ERRORS:
+                    self.log(logging.ERROR, 'Window callback failed %d times in a row, giving up.' % self.callback_errors)
+                    # stopping from here would join this very thread, leave it to the caller
+                    self.monitor.should_stop.set()
+
+    def deliver(self, window, info):
+        if self.queue is not None:
+            # the window is only borrowed from the ring, the queue keeps its own copy
+            self.queue.put(window, info)
+            return
+        try:
+            if info is None:
+                self.config['window_callback'](window)
+            else:
+                self.config['window_callback'](window, info)
+        except:
+            traceback.print_exc()
+            self.monitor.stop()
+
+    def is_next(self, stream):
+        return self.next_stream is not None and c.addressof(stream.contents) == c.addressof(self.next_stream.contents)
+
+    def switch_over(self):
+        # the new stream is ready, so the old one can go without a gap in between
+        self.disconnect(self.stream)
+        self.stream, self.sink_name = self.next_stream, self.next_sink_name
+        self.next_stream = None
+        self.set_sample_rate(self.next_sample_rate)
+        self.remember_source(self.stream)
+        self.log(logging.INFO, 'Switched to "%s".' % self.sink_name)
+        self.corked = False
+        self.cork(self.stream, bool(pa_stream_is_suspended(self.stream)))
+
+    def cork(self, stream, corked):
+        '''
+        in idle mode, corks the stream while the sink is suspended (and uncorks it after)
+        '''
+        if not self.config.get('idle_when_suspended') or corked == self.corked:
+            return
+        # no success callback, but ctypes only takes a NULL function pointer for it, not None
+        pa_operation_unref(pa_stream_cork(stream, int(corked), pa_stream_success_cb_t(), None))
+        self.corked = corked
+        # whatever is still pending is stale by the time the sink resumes
+        self.framer.clear()
+        self.log(logging.DEBUG, 'Corked until the sink resumes.' if corked else 'Uncorked.')
+
+    def state_cb(self, stream, userdata):
+        if self.monitor.context_state != PA_CONTEXT_READY:
+            return
+        state = pa_stream_get_state(stream)
+        msg, level = {
+            PA_STREAM_CREATING: ('Creating...', logging.DEBUG),
+            PA_STREAM_READY: ('Ready.', logging.DEBUG),
+            PA_STREAM_FAILED: ('Failed!', logging.ERROR),
+            PA_STREAM_TERMINATED: ('Terminated.', logging.DEBUG),
+        }[state]
+        self.log(level, msg)
+        if self.is_next(stream):
+            if state == PA_STREAM_READY:
+                self.switch_over()
+            elif state == PA_STREAM_FAILED:
+                # keep recording the old sink, the next change of the default sink tries again
+                self.disconnect(self.next_stream)
+                self.next_stream = None
+            return
+        if state == PA_STREAM_READY:
+            self.monitor.failures = 0
+            self.log_channel_map(stream)
+            self.cork(stream, bool(pa_stream_is_suspended(stream)))
+            self.remember_source(stream)
+        elif state == PA_STREAM_FAILED:
+            # the source may be gone, the retry asks the server again
+            self.last_source = None
+            self.stop()
+            # restarts every stream that isn't running
+            self.monitor.schedule_retry(self.monitor.start_streams)
+
+    def log_channel_map(self, stream):
+        channel_map = pa_stream_get_channel_map(stream).contents
+        self.channel_positions = [py_string(pa_channel_position_to_string(channel_map.map[i])) for i in range(channel_map.channels)]
+        self.log(logging.DEBUG, 'Channel map is %s.' % ','.join(self.channel_positions))
+
+    def suspended_cb(self, stream, userdata):
+        if self.is_next(stream):
+            return
+        is_suspended = bool(pa_stream_is_suspended(stream))
+        status = {
+            True: 'Suspended.',
+            False: 'Resumed.',
+        }[is_suspended]
+        self.log(logging.DEBUG, status)
+        if is_suspended:
+            self.config['suspended_callback']()
+        self.cork(stream, is_suspended)
+
+    def moved_cb(self, stream, userdata):
+        source_name = py_string(pa_stream_get_device_name(stream))
+        self.log(logging.INFO, 'Moved to "%s".' % source_name)
+
+    def overflow_cb(self, stream, userdata):
+        self.overflows += 1
+        self.log(logging.DEBUG, 'Overflow, the server dropped data.')
+
+    def read_cb(self, stream, nbytes, userdata):
+        if self.is_next(stream):
+            # keep reading the old stream until the new one takes over
+            while pa_stream_peek(stream, *self.peek_args) == 0 and self.peek_bytes.value:
+                pa_stream_drop(stream)
+            return
+        while True:
+            pa_stream_peek(stream, *self.peek_args)
+            if self.peek_bytes.value == 0:
+                break
+            if not self.peek_data:
+                # a hole in the stream, fill it with silence so the timeline stays continuous
+                self.holes += 1
+                self.framer.fill(self.peek_bytes.value // self.frame_size)
+                pa_stream_drop(stream)
+                continue
+            fragment = fragment_view(self.peek_data.value, self.peek_bytes.value, self.fragment_dtype)
+            if self.pa_format == PA_SAMPLE_S24LE:
+                fragment = unpack_s24(fragment)
+            self.framer.write(fragment.reshape(-1, self.config['channels']), self.sample_scale)
+            pa_stream_drop(stream)
+        timing = self.stream_timing(stream) if self.config.get('timing') else None
+        if self.config.get('batch'):
+            self.deliver_batch(timing)
+            self.log_stats()
+            return
+        # the windows are views into the ring, only valid until the next one is taken
+        for window in self.framer.windows():
+            info = None if timing is None else self.window_info(timing)
+            if self.recorders:
+                self.record(window, info or WindowInfo(self.framer.window_index(), time.time(), None, None))
+            self.deliver(window, info)
+            if self.stream is None:
+                # the window callback failed and stopped everything
+                return
+        self.log_stats()
+
+    def deliver_batch(self, timing):
+        self.framer.drop_excess()
+        info = None if timing is None else self.window_info(timing)
+        batch = self.framer.batch()
+        if batch is None:
+            return
+        if self.recorders:
+            first = info or WindowInfo(self.framer.window_index() - len(batch), time.time(), None, None)
+            hop_time = float(self.framer.hop_size) / self.sample_rate
+            for i, window in enumerate(batch):
+                stream_time = None if first.stream_time is None else first.stream_time + i * hop_time
+                self.record(window, first._replace(index=first.index + i,
+                                                   capture_time=first.capture_time + i * hop_time,
+                                                   stream_time=stream_time))
+        self.deliver(batch, info)
+
+    def record(self, window, info):
+        for recorder in self.recorders:
+            recorder.write(window, info)
+
+    def close_recorders(self):
+        for recorder in self.recorders:
+            recorder.close()
+        self.recorders = []
+
+    def stream_timing(self, stream):
+        '''
+        returns the current time, the source latency and the stream time (both in seconds,
+        or None while PulseAudio has no timing info yet) for the newest sample read
+        '''
+        now = time.time()
+        latency = stream_time = None
+        if pa_stream_get_latency(stream, c.byref(self.latency_usec), c.byref(self.latency_negative)) == 0:
+            latency = self.latency_usec.value / 1e6
+            if self.latency_negative.value:
+                latency = -latency
+        if pa_stream_get_time(stream, c.byref(self.stream_usec)) == 0:
+            stream_time = self.stream_usec.value / 1e6
+        return now, latency, stream_time
+
+    def window_info(self, timing):
+        now, latency, stream_time = timing
+        # the window ends this long before the newest sample read
+        behind = float(self.framer.samples_behind()) / self.sample_rate
+        capture_time = now - (latency or 0) - behind
+        if stream_time is not None:
+            stream_time -= behind
+        return WindowInfo(self.framer.window_index(), capture_time, latency, stream_time)
+
+    def log_stats(self):
+        rates = self.framer.rates(time.time(), STATS_INTERVAL)
+        if rates is not None:
+            self.log(logging.DEBUG, '%.1f windows/s emitted, %.1f windows/s dropped.' % rates)
+            self.log(logging.DEBUG, '%d overflows, %d holes so far.' % (self.overflows, self.holes))
+            if self.queue is not None:
+                self.log(logging.DEBUG, 'Queue depth %d (at most %d so far), %d windows dropped by the queue.' %
+                         (len(self.queue), self.queue.max_depth, self.queue.dropped))
+
 
 class PulseAudioMonitor(object):
     '''
     Listens to the monitor source of the default sink at the default PulseAudio server
-    and calls a callback function with a jumping sample window.
+    and calls a callback function with a sliding window of exactly samples_per_window samples,
+    advanced by hop_size samples (defaults to samples_per_window, i.e. no overlap).
+    With config['channels'] > 1, windows are (channels, samples) arrays in the order of
+    config['channel_map'] (e.g. 'front-left,front-right', defaults to PulseAudio's standard map).
+    config['sample_format'] selects the format on the wire (see SAMPLE_FORMATS, e.g. 's16le' halves
+    the bandwidth to a remote server), windows are always normalized float32 samples.
+    config['meter_rate'] switches to meter mode, see MonitorStream.
+    Streams record at the sample rate of their sink, so the server doesn't have to resample
+    (see MonitorStream.stream_sample_rate() for the alternatives). config['sample_rate_callback']
+    is called with the rate before the first window and whenever it changes.
+    With config['timing'] set, the window callback gets a WindowInfo as second argument,
+    telling when the window was captured and how large the source latency was.
+
+    To record several sinks over the same connection, config['streams'] lists one dict per stream
+    with its 'sink' name (None for the default sink), its own 'window_callback' and 'suspended_callback',
+    and optionally any other of the keys above, which otherwise default to the ones in config.
+    A path or shared memory name in config that every stream writes to on its own (see PER_STREAM_KEYS)
+    gets the name of the stream ('name', or else its sink) appended, unless the stream sets its own.
 
     run() starts the PulseAudio event loop.
+    With config['threaded'] set (or when calling start() directly), the event loop runs in
+    a pa_threaded_mainloop thread instead and the window callback of every stream is called from
+    a consumer thread of its own, so a slow callback never delays reading from the stream
+    (see MonitorStream for the queue in between).
     Simplified modus operandi:
     - create a context
     - when the context is ready, query server info to find out the name of the default sink
-    - query the name of the monitor source
+    - query the name of the monitor source of every sink to record
     - register a read callback to that source
     - wait for enough data, then call the window callback
     '''
 
     def __init__(self, config):
+        self.mainloop = None
+        self.threaded_mainloop = None
+        self.should_stop = Event()
         self.context = None
-        self.stream = None
-        self.wait_time = 0
+        self.default_sink_name = None
+        self.failures = 0
+        self.retry_event = None
+        self.retry_action = None
         self.config = config
-        self.config['bytes_per_window'] = config['samples_per_window'] * c.sizeof(c.c_float)
-
-        self.check_issue10744()
+        stream_configs = config.pop('streams', [{}])
+        self.streams = []
+        for stream_config in stream_configs:
+            merged = dict(config)
+            merged.update(stream_config)
+            if len(stream_configs) > 1:
+                for key in PER_STREAM_KEYS:
+                    if merged.get(key) and key not in stream_config:
+                        # one each, told apart by the stream name (e.g. 'tap-default.bin')
+                        root, ext = os.path.splitext(merged[key])
+                        merged[key] = '%s-%s%s' % (root, stream_name(merged), ext)
+            self.streams.append(MonitorStream(self, merged))
 
         # keep references to callback casts to prevent them from being garbage collected
         self.c_signal_cb = pa_signal_cb_t(self.signal_cb)
+        self.c_retry_cb = pa_time_event_cb_t(self.retry_cb)
         self.c_context_state_cb = pa_context_notify_cb_t(self.context_state_cb)
         self.c_context_server_info_cb = pa_server_info_cb_t(self.context_server_info_cb)
-        self.c_context_sink_info_cb = pa_sink_info_cb_t(self.context_sink_info_cb)
-        self.c_stream_state_cb = pa_stream_notify_cb_t(self.stream_state_cb)
-        self.c_stream_suspended_cb = pa_stream_notify_cb_t(self.stream_suspended_cb)
-        self.c_stream_moved_cb = pa_stream_notify_cb_t(self.stream_moved_cb)
-        self.c_stream_read_cb = pa_stream_request_cb_t(self.stream_read_cb)
-
-    def check_issue10744(self):
-        '''
-        swallows the initial warning but warns if it has changed,
-        see http://bugs.python.org/issue10744
-        '''
-        import warnings
-        with warnings.catch_warnings(record=True):
-            if np.ctypeslib.as_array((c.c_float * 1)()).ndim == 1:
-                log.warn('########################################################################')
-                log.warn('Looks like issue 10744 has been fixed. You should remove the workaround.')
-                log.warn('########################################################################')
-            np.ctypeslib.as_array((c.c_float * 2)())
+        self.c_context_subscribe_cb = pa_context_subscribe_cb_t(self.context_subscribe_cb)
 
     def run(self):
+        if self.config.get('threaded'):
+            self.run_threaded()
+            return
         self.mainloop = pa_mainloop_new()
         self.mainloop_api = pa_mainloop_get_api(self.mainloop)
         pa_signal_init(self.mainloop_api)
@@ -72,54 +615,85 @@ class PulseAudioMonitor(object):
         log.debug('Entering main loop...')
         pa_mainloop_run(self.mainloop, None)
 
+    def run_threaded(self):
+        signal.signal(SIGTERM, lambda signum, frame: self.should_stop.set())
+        self.start()
+        try:
+            # wake up regularly, Python 2 doesn't deliver ^C to a blocking wait()
+            while not self.should_stop.wait(1):
+                pass
+        except KeyboardInterrupt:
+            pass
+        self.stop()
+
+    def start(self):
+        '''
+        starts the event loop in its own thread and returns immediately,
+        should_stop is set when a window callback keeps failing, the caller is expected to call stop() then
+        '''
+        self.should_stop.clear()
+        for stream in self.streams:
+            stream.start_consumer()
+        self.threaded_mainloop = pa_threaded_mainloop_new()
+        self.mainloop_api = pa_threaded_mainloop_get_api(self.threaded_mainloop)
+        pa_threaded_mainloop_lock(self.threaded_mainloop)
+        self.start_context()
+        log.debug('Starting main loop thread...')
+        pa_threaded_mainloop_start(self.threaded_mainloop)
+        pa_threaded_mainloop_unlock(self.threaded_mainloop)
+
     def stop(self):
+        ''' stops the event loop, for good: taps and publishers are closed '''
+        self.stop_threaded()
         if self.mainloop is not None:
             # put the ^C onto a separate line (looks better)
-            print
+            print('')
             self.stop_context()
             log.info('Stopping...')
             self.mainloop_api.contents.quit(self.mainloop_api, 0)
             pa_signal_done()
             pa_mainloop_free(self.mainloop)
             self.mainloop = None
+        for stream in self.streams:
+            stream.close_recorders()
+
+    def stop_threaded(self):
+        if self.threaded_mainloop is None:
+            return
+        # put the ^C onto a separate line (looks better)
+        print('')
+        log.info('Stopping...')
+        pa_threaded_mainloop_lock(self.threaded_mainloop)
+        self.stop_context()
+        pa_threaded_mainloop_unlock(self.threaded_mainloop)
+        pa_threaded_mainloop_stop(self.threaded_mainloop)
+        pa_threaded_mainloop_free(self.threaded_mainloop)
+        self.threaded_mainloop = None
+        # nothing is put into the queues anymore
+        for stream in self.streams:
+            stream.stop_consumer()
+        self.should_stop.set()
 
     def start_context(self):
-        self.context = pa_context_new(self.mainloop_api, CONTEXT_NAME)
+        self.context = pa_context_new(self.mainloop_api, c_string(CONTEXT_NAME))
         pa_context_set_state_callback(self.context, self.c_context_state_cb, None)
         pa_context_connect(self.context, None, PA_CONTEXT_NOFLAGS, None)
         self.context_state = PA_CONTEXT_UNCONNECTED
+        self.default_sink_name = None
 
     def stop_context(self):
+        self.cancel_retry()
         if self.context is not None:
-            self.stop_stream()
+            for stream in self.streams:
+                stream.stop()
             pa_context_disconnect(self.context)
             pa_context_unref(self.context)
             self.context = None
 
-    def start_stream(self):
-        # we can't just start the stream, we first need to query some info
+    def start_streams(self):
+        # we can't just start the streams, we first need to query some info
         pa_operation_unref(pa_context_get_server_info(self.context, self.c_context_server_info_cb, None))
 
-    def do_start_stream(self, source_name):
-        # now that we know the name of the source we want to record, we can actually start the stream
-        sample_spec = pa_sample_spec(format=PA_SAMPLE_FLOAT32LE, rate=SAMPLE_RATE, channels=1)
-        proplist = pa_proplist_from_string(PA_PROP_APPLICATION_ICON_NAME + '="python"')
-        self.stream = pa_stream_new_with_proplist(self.context, STREAM_NAME, sample_spec, None, proplist)
-        pa_proplist_free(proplist)
-        pa_stream_set_state_callback(self.stream, self.c_stream_state_cb, None)
-        pa_stream_set_suspended_callback(self.stream, self.c_stream_suspended_cb, None)
-        pa_stream_set_moved_callback(self.stream, self.c_stream_moved_cb, None)
-        pa_stream_set_read_callback(self.stream, self.c_stream_read_cb, None)
-        buffer_attr = pa_buffer_attr(-1, -1, -1, -1, fragsize=self.config['bytes_per_window'])
-        flags = PA_STREAM_ADJUST_LATENCY | PA_STREAM_DONT_INHIBIT_AUTO_SUSPEND
-        pa_stream_connect_record(self.stream, source_name, buffer_attr, flags)
-
-    def stop_stream(self):
-        if self.stream is not None:
-            pa_stream_disconnect(self.stream)
-            pa_stream_unref(self.stream)
-            self.stream = None
-
     def signal_cb(self, mainloop_api, signal_event, signal, userdata):
         self.stop()
 
@@ -135,89 +709,65 @@ class PulseAudioMonitor(object):
         }[state]
         log.log(level, 'context: ' + msg)
         if state == PA_CONTEXT_READY:
-            self.wait_time = 0
-            self.start_stream()
+            self.failures = 0
+            # follow changes of the default sink (reported as server changes) and of the sinks themselves
+            pa_context_set_subscribe_callback(context, self.c_context_subscribe_cb, None)
+            # no success callback, but ctypes only takes a NULL function pointer for it, not None
+            pa_operation_unref(pa_context_subscribe(context, PA_SUBSCRIPTION_MASK_SERVER | PA_SUBSCRIPTION_MASK_SINK,
+                                                    pa_context_success_cb_t(), None))
+            # after a reconnect, record the same sources as before right away, start_streams() checks them
+            for stream in self.streams:
+                stream.reconnect(context)
+            self.start_streams()
         elif state == PA_CONTEXT_FAILED:
             self.stop_context()
-            time.sleep(self.wait_time)
-            self.wait_time += 1
-            self.start_context()
-
-    def context_server_info_cb(self, context, server_info, userdata):
-        si = server_info.contents
-        if not pa_context_is_local(context):
-            log.info('context: Connected to %s %s running as %s on %s.' % (si.server_name, si.server_version, si.user_name, si.host_name))
-        # we got the default sink name, query its monitor source name
-        pa_operation_unref(pa_context_get_sink_info_by_name(context, si.default_sink_name, self.c_context_sink_info_cb, None))
-
-    def context_sink_info_cb(self, context, sink_info, eol, userdata):
-        if eol:
-            return
-        # we got the monitor source name of the default sink, connect to it
-        self.do_start_stream(sink_info.contents.monitor_source_name)
+            self.schedule_retry(self.start_context)
 
-    def stream_state_cb(self, stream, userdata):
-        if self.context_state != PA_CONTEXT_READY:
-            return
-        state = pa_stream_get_state(stream)
-        msg, level = {
-            PA_STREAM_CREATING: ('Creating...', logging.DEBUG),
-            PA_STREAM_READY: ('Ready.', logging.DEBUG),
-            PA_STREAM_FAILED: ('Failed!', logging.ERROR),
-            PA_STREAM_TERMINATED: ('Terminated.', logging.DEBUG),
-        }[state]
-        log.log(level, 'stream: ' + msg)
-        if state == PA_STREAM_READY:
-            self.wait_time = 0
-        elif state == PA_STREAM_FAILED and self.context_state == PA_CONTEXT_READY:
-            self.stop_stream()
-            time.sleep(self.wait_time)
-            self.wait_time += 1
-            self.start_stream()
-
-    def stream_suspended_cb(self, stream, userdata):
-        is_suspended = bool(pa_stream_is_suspended(stream))
-        status = {
-            True: 'Suspended.',
-            False: 'Resumed.',
-        }[is_suspended]
-        log.debug('stream: ' + status)
-        if is_suspended:
-            self.config['suspended_callback']()
-
-    def stream_moved_cb(self, stream, userdata):
-        source_name = pa_stream_get_device_name(stream)
-        log.info('stream: Moved to "%s".' % source_name)
+    def schedule_retry(self, action):
+        '''
+        calls action after a delay that doubles with every consecutive failure (up to RETRY_DELAY_MAX),
+        using a time event so the main loop keeps running in the meantime
+        '''
+        self.cancel_retry()
+        delay = min(RETRY_DELAY_MAX, RETRY_DELAY_MIN * 2 ** self.failures)
+        # spread out the retries of many clients after a server restart
+        delay *= random.uniform(0.5, 1.0)
+        self.failures += 1
+        log.info('Retrying in %.1f seconds...' % delay)
+        when = time.time() + delay
+        tv = timeval(int(when), int(when % 1 * 1e6))
+        self.retry_action = action
+        self.retry_event = self.mainloop_api.contents.time_new(self.mainloop_api, tv, self.c_retry_cb, None)
 
-    def stream_read_cb(self, stream, nbytes, userdata):
-        # 0.9 is an empirical value to get an average window size close to the wanted size.
-        # probably depends on network latency and whatnot...
-        if nbytes < self.config['bytes_per_window'] * 0.9:
-            # wait for more data
-            return
+    def cancel_retry(self):
+        if self.retry_event is not None:
+            self.mainloop_api.contents.time_free(self.retry_event)
+            self.retry_event = None
+            self.retry_action = None
 
-        window = None
-        while True:
-            data = c.c_void_p()
-            bytes_read = c.c_size_t()
-            pa_stream_peek(stream, c.byref(data), c.byref(bytes_read))
-            if bytes_read.value == 0:
-                break
-            samples_read = bytes_read.value / c.sizeof(c.c_float)
-            c_samples = c.cast(data, c.POINTER(c.c_float * samples_read))
-            np_samples = np.ctypeslib.as_array(c_samples.contents)
+    def retry_cb(self, mainloop_api, time_event, tv, userdata):
+        action = self.retry_action
+        self.cancel_retry()
+        action()
 
-            # work around http://bugs.python.org/issue10744
-            if np_samples.ndim == 2:
-                np_samples = np_samples[0]
+    def context_subscribe_cb(self, context, event_type, index, userdata):
+        facility = event_type & PA_SUBSCRIPTION_EVENT_FACILITY_MASK
+        kind = event_type & PA_SUBSCRIPTION_EVENT_TYPE_MASK
+        # sinks change all the time (e.g. their volume), only new or removed ones matter
+        if facility == PA_SUBSCRIPTION_EVENT_SERVER or (facility == PA_SUBSCRIPTION_EVENT_SINK and kind != PA_SUBSCRIPTION_EVENT_CHANGE):
+            # the default sink may have changed, query it again
+            self.start_streams()
 
-            if window is None:
-                window = np_samples
-            else:
-                window = np.concatenate((window, np_samples))
-            pa_stream_drop(stream)
-        try:
-            self.config['window_callback'](window)
-        except:
-            traceback.print_exc()
-            self.stop()
+    def context_server_info_cb(self, context, server_info, userdata):
+        si = server_info.contents
+        default_sink_name = py_string(si.default_sink_name)
+        if self.default_sink_name is None:
+            if not pa_context_is_local(context):
+                log.info('context: Connected to %s %s running as %s on %s.' %
+                         tuple(py_string(s) for s in (si.server_name, si.server_version, si.user_name, si.host_name)))
+        elif default_sink_name != self.default_sink_name:
+            log.info('context: Default sink changed to "%s".' % default_sink_name)
+        self.default_sink_name = default_sink_name
+        # we got the default sink name, now every stream can query the name of its monitor source
+        for stream in self.streams:
+            stream.follow(context, default_sink_name)
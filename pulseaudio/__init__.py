@@ -1,3 +1,8 @@
 #!/usr/bin/env python
 
-from lib_pulseaudio import *
+import sys
+from .lib_pulseaudio import *
+from .lib_pulseaudio import _lazy_module
+
+# functions are resolved on first access here as well, import them by name
+_lazy_module(sys.modules[__name__])
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+#
+# Measures how long importing the bindings (and pulse.py, which resolves the functions it uses)
+# takes in a fresh interpreter, the best of a few runs.
+#
+# usage: benchmark.py [runs]
+#
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    'import pulseaudio',
+    'from pulseaudio import *',
+    'import pulse',
+]
+
+TIMED = '''
+import time
+start = time.time()
+%s
+print(time.time() - start)
+'''
+
+
+def measure(statement, runs):
+    times = []
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', TIMED % statement], cwd=ROOT)
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for statement in STATEMENTS:
+        print('%-30s %6.1f ms' % (statement, measure(statement, runs) * 1000))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# Rewrites the bindings generated by xml2py so that functions are only looked up in libpulse
+# (and get their argtypes and restype) on first access, see RUNTIME below.
+# Constants, structures and callback types stay as they are, they refer to each other
+# (except for long literals, which Python 3 doesn't have).
+#
+# usage: lazify.py lib_pulseaudio.py
+#
+
+import re
+import sys
+import textwrap
+
+
+LIBRARY = 'libpulse.so.0'
+
+FUNCTION = re.compile(
+    r"^(?P<name>\w+) = _libraries\['%s'\]\.(?P=name)\n"
+    r"(?P=name)\.restype = (?P<restype>.*)\n"
+    r"(?P=name)\.argtypes = (?P<argtypes>.*)\n"
+    r"(?P=name)\.__doc__ = \\\n"
+    r'(?P<doc>""".*?""")\n' % re.escape(LIBRARY),
+    re.MULTILINE | re.DOTALL)
+
+# Python 2 long literals, e.g. PA_CHANNELS_MAX = 32L
+LONG = re.compile(r'^(\w+ = \d+)L\b', re.MULTILINE)
+
+ALL = re.compile(r'^__all__ = \[.*?\]\n', re.MULTILINE | re.DOTALL)
+
+IMPORTS = '''from ctypes import *
+from types import ModuleType
+import sys
+'''
+
+RUNTIME = '''
+
+def _resolve(name):
+    function = getattr(_libraries['%s'], name)
+    restype, argtypes, doc = _functions[name]
+    function.restype = eval(restype)
+    function.argtypes = eval(argtypes)
+    function.__doc__ = doc
+    globals()[name] = function
+    return function
+
+
+class _LazyModule(ModuleType):
+    \'\'\'
+    A module whose functions from _functions are resolved on first access,
+    so importing it only pays for the functions that are actually used.
+    They are left out of __all__, import them by name.
+    \'\'\'
+
+    def __getattr__(self, name):
+        if name not in _functions:
+            raise AttributeError("module '%%s' has no attribute '%%s'" %% (self.__name__, name))
+        function = globals().get(name) or _resolve(name)
+        setattr(self, name, function)
+        return function
+
+
+def _lazy_module(module):
+    \'\'\' replaces module in sys.modules by a _LazyModule with the same contents \'\'\'
+    lazy = _LazyModule(module.__name__, module.__doc__)
+    lazy.__dict__.update(module.__dict__)
+    # Python 2 clears the globals of a module once it is garbage collected
+    lazy._module = module
+    sys.modules[module.__name__] = lazy
+'''
+
+TRAILER = '''
+_lazy_module(sys.modules[__name__])
+'''
+
+
+def lazify(source):
+    functions = []
+
+    def collect(match):
+        functions.append(match.group('name', 'restype', 'argtypes', 'doc'))
+        return ''
+
+    source = FUNCTION.sub(collect, source)
+    # so the bindings work with Python 3 as well
+    source = LONG.sub(r'\1', source)
+    assert source.startswith('from ctypes import *\n')
+    source = IMPORTS + source[len('from ctypes import *\n'):]
+
+    table = ['# functions are looked up in %s on first access, see _LazyModule' % LIBRARY, '_functions = {']
+    for name, restype, argtypes, doc in sorted(functions):
+        table.append('    %r: (%r, %r, %s),' % (name, restype, argtypes, doc))
+    table.append('}')
+
+    names = set(name for name, restype, argtypes, doc in functions)
+    match = ALL.search(source)
+    exported = [name for name in eval(match.group(0)[len('__all__ = '):]) if name not in names]
+    all_ = textwrap.fill(', '.join(repr(name) for name in exported), 70,
+                         initial_indent='__all__ = [', subsequent_indent='           ') + ']\n'
+    return source[:match.start()] + '\n'.join(table) + '\n' + RUNTIME % LIBRARY + '\n' + all_ + source[match.end():] + TRAILER
+
+
+if __name__ == '__main__':
+    path = sys.argv[1]
+    with open(path) as f:
+        source = f.read()
+    with open(path, 'w') as f:
+        f.write(lazify(source))
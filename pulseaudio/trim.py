@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+# Trims the bindings generated by xml2py down to the names that are actually used,
+# together with everything they refer to (structures, callback and argument types, ...).
+# The names are either listed in an allowlist file (one per line, # starts a comment)
+# or found by scanning Python files for identifiers the bindings define.
+#
+# usage: trim.py lib_pulseaudio.py --allowlist FILE
+#        trim.py lib_pulseaudio.py --used FILE...
+#
+
+import re
+import sys
+import textwrap
+import tokenize
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+
+
+def statements(source):
+    '''
+    splits source into top-level statements, each one with the comments before it and its indented block,
+    returns a list of (defined name, referenced names, text), the name is None for imports
+    '''
+    lines = source.splitlines(True)
+    ends = []  # last row of every statement
+    names = []  # identifiers of every statement
+    depth = 0
+    at_start = True
+    for token in tokenize.generate_tokens(StringIO(source).readline):
+        kind = token[0]
+        if kind == tokenize.INDENT:
+            depth += 1
+        elif kind == tokenize.DEDENT:
+            depth -= 1
+            at_start = True
+        elif kind == tokenize.NEWLINE:
+            ends[-1] = token[3][0]
+            at_start = depth == 0
+        elif kind not in (tokenize.NL, tokenize.COMMENT, tokenize.ENDMARKER):
+            if at_start and depth == 0:
+                ends.append(token[2][0])
+                names.append([])
+                at_start = False
+            if kind == tokenize.NAME:
+                names[-1].append(token[1])
+    parsed = []
+    start = 0
+    for end, identifiers in zip(ends, names):
+        text = ''.join(lines[start:end])
+        start = end
+        if identifiers[0] == 'class':
+            identifiers = identifiers[1:]
+        elif identifiers[0] in ('from', 'import'):
+            identifiers = [None] + identifiers
+        parsed.append((identifiers[0], set(identifiers[1:]), text))
+    # whatever follows the last statement (e.g. comments)
+    if start < len(lines):
+        parsed.append((None, set(), ''.join(lines[start:])))
+    return parsed
+
+
+def trim(source, roots):
+    parsed = statements(source)
+    defined = set(name for name, references, text in parsed if name is not None)
+    needed = set(roots) & defined
+    pending = list(needed)
+    while pending:
+        name = pending.pop()
+        for defines, references, text in parsed:
+            if defines == name:
+                for reference in references & defined - needed:
+                    needed.add(reference)
+                    pending.append(reference)
+    output = []
+    for name, references, text in parsed:
+        if name == '__all__':
+            exported = [n for n in eval(text[len('__all__ = '):]) if n in needed]
+            text = textwrap.fill(', '.join(repr(n) for n in exported), 70,
+                                 initial_indent='__all__ = [', subsequent_indent='           ') + ']\n'
+        elif name is not None and name not in needed:
+            continue
+        output.append(text)
+    return ''.join(output)
+
+
+def used_names(paths):
+    names = set()
+    for path in paths:
+        with open(path) as f:
+            names.update(IDENTIFIER.findall(f.read()))
+    return names
+
+
+def allowed_names(path):
+    with open(path) as f:
+        return set(line.split('#')[0].strip() for line in f) - set([''])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4 or sys.argv[2] not in ('--allowlist', '--used'):
+        sys.exit('usage: trim.py lib_pulseaudio.py --allowlist FILE | --used FILE...')
+    path = sys.argv[1]
+    roots = allowed_names(sys.argv[3]) if sys.argv[2] == '--allowlist' else used_names(sys.argv[3:])
+    with open(path) as f:
+        source = f.read()
+    with open(path, 'w') as f:
+        f.write(trim(source, roots))
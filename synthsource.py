@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+from window import WindowSource
+import math
+import numpy as np
+import logging
+import time
+
+
+SAMPLE_RATE = 44100  # in samples per second
+BLOCK_WINDOWS = 16  # hops generated at once
+
+log = logging.getLogger(__name__)
+
+
+class SynthSource(WindowSource):
+    '''
+    Drop-in replacement for PulseAudioMonitor that generates test signals, for load-testing
+    the analysis and LED output path.
+
+    Takes the same config as PulseAudioMonitor (samples_per_window, hop_size, channels,
+    window_callback, suspended_callback, sample_rate_callback, timing) plus:
+    - 'signal': 'sweep' (logarithmic sine sweep from 'sweep_from' to 'sweep_to' Hz, every 'sweep_time' s),
+      'noise' (white noise), 'clicks' (a click train at 'bpm' beats per minute) or 'silence'
+    - 'amplitude': peak amplitude (default 0.5)
+    - 'gap_every', 'gap_length': every gap_every seconds, the source goes silent for gap_length seconds,
+      like a suspended sink: suspended_callback is called and no windows are delivered meanwhile
+    - 'speed': multiple of real time to deliver windows at (e.g. 10), None for as fast as possible
+    - 'duration': seconds of signal to generate, None to run until stop()
+    Samples are generated in vectorized blocks of BLOCK_WINDOWS hops.
+    '''
+
+    def __init__(self, config):
+        self.config = config
+        self.config.setdefault('hop_size', config['samples_per_window'])
+        self.config.setdefault('channels', 1)
+        self.config.setdefault('sample_rate', SAMPLE_RATE)
+        self.config.setdefault('signal', 'noise')
+        self.config.setdefault('amplitude', 0.5)
+        self.sample_rate = config['sample_rate']
+        self.generate = {
+            'sweep': self.sweep,
+            'noise': self.noise,
+            'clicks': self.clicks,
+            'silence': self.silence,
+        }[config['signal']]
+        self.random = np.random.RandomState(config.get('seed'))
+        WindowSource.__init__(self, config, config['channels'], BLOCK_WINDOWS)
+
+    def sweep(self, t):
+        f0 = self.config.get('sweep_from', 20.0)
+        f1 = self.config.get('sweep_to', 20000.0)
+        period = self.config.get('sweep_time', 10.0)
+        k = math.log(f1 / f0)
+        phase = 2 * math.pi * f0 * period / k * (np.exp(t % period / period * k) - 1)
+        return np.sin(phase)
+
+    def noise(self, t):
+        return self.random.uniform(-1.0, 1.0, len(t))
+
+    def clicks(self, t):
+        beat = 60.0 / self.config.get('bpm', 120.0)
+        since_beat = t % beat
+        # 5 ms exponentially decaying clicks
+        return np.where(since_beat < 0.005, np.exp(-since_beat / 0.001), 0.0)
+
+    def silence(self, t):
+        return np.zeros(len(t))
+
+    def gap(self, position):
+        ''' returns start and end of the first gap that ends after the sample at position '''
+        if not self.config.get('gap_every'):
+            return float('inf'), float('inf')
+        period = int(self.config['gap_every'] * self.sample_rate)
+        gap_end = position - position % period + period
+        return gap_end - int(self.config['gap_length'] * self.sample_rate), gap_end
+
+    def run(self):
+        ''' blocks until duration has been generated or stop() has been called '''
+        self.should_stop = False
+        block_size = BLOCK_WINDOWS * self.config['hop_size']
+        channels = self.config['channels']
+        speed = self.config.get('speed')
+        duration = self.config.get('duration')
+        if self.config.get('sample_rate_callback'):
+            self.config['sample_rate_callback'](self.sample_rate)
+        end_sample = float('inf') if duration is None else int(duration * self.sample_rate)
+        start_time = time.time()
+        position = 0
+        emitted = self.framer.emitted
+        while not self.should_stop and position < end_sample:
+            gap_start, gap_end = self.gap(position)
+            if position >= gap_start:
+                log.debug('Gap until %.1f s.' % (float(gap_end) / self.sample_rate))
+                self.config['suspended_callback']()
+                # nothing is delivered during the gap, the windows after it start from scratch
+                self.framer.clear()
+                self.framer.position = position = gap_end
+                continue
+            stop = min(position + block_size, gap_start, end_sample)
+            t = np.arange(position, stop) / float(self.sample_rate)
+            block = self.config['amplitude'] * self.generate(t)
+            # the same signal on every channel
+            self.framer.write(np.broadcast_to(block[:, np.newaxis], (len(block), channels)))
+            position = stop
+            self.deliver_windows(start_time, speed)
+        elapsed = max(time.time() - start_time, 1e-6)
+        windows = self.framer.emitted - emitted
+        log.info('%d windows in %.2f s, %.1f windows/s, %.1fx real time.' %
+                 (windows, elapsed, windows / elapsed, float(position) / self.sample_rate / elapsed))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+from window import WindowInfo
+import numpy as np
+import os
+
+
+MAGIC = b'WTAP'
+HEADER_SIZE = 4096  # one page, so the records are page aligned
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('channels', '<u4'),
+    ('samples', '<u4'),
+    ('slots', '<u4'),
+    ('count', '<u8'),  # number of windows written so far
+])
+
+
+def record_dtype(channels, samples):
+    shape = (samples,) if channels == 1 else (channels, samples)
+    return np.dtype([
+        ('index', '<i8'),
+        ('capture_time', '<f8'),
+        ('latency', '<f8'),  # NaN if unknown
+        ('stream_time', '<f8'),  # NaN if unknown
+        ('samples', '<f4', shape),
+    ])
+
+
+class WindowTap(object):
+    '''
+    Records the last slots windows and their WindowInfo into a memory-mapped ring file,
+    to find out what the monitor actually saw when the lights misbehaved.
+
+    The file is allocated up front and written through the mapping only, so a window
+    costs one memory copy and no system calls (the kernel writes the dirty pages back).
+    The window count in the header is updated after the record, so a reader never sees
+    a record that is only half written.
+    A tap left over from before (e.g. before the monitor was restarted) is kept as path + '.1'.
+    '''
+
+    def __init__(self, path, channels, samples, slots):
+        size = HEADER_SIZE + slots * record_dtype(channels, samples).itemsize
+        if os.path.exists(path):
+            previous = path + '.1'
+            if os.path.exists(previous):
+                # os.rename doesn't replace it on Windows
+                os.remove(previous)
+            os.rename(path, previous)
+        with open(path, 'wb') as f:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(f.fileno(), 0, size)
+            else:
+                f.truncate(size)
+        self.header = np.memmap(path, dtype=HEADER_DTYPE, mode='r+', shape=(1,))[0]
+        self.header['magic'] = MAGIC
+        self.header['channels'] = channels
+        self.header['samples'] = samples
+        self.header['slots'] = slots
+        self.header['count'] = 0
+        self.records = np.memmap(path, dtype=record_dtype(channels, samples), mode='r+',
+                                 offset=HEADER_SIZE, shape=(slots,))
+        self.slots = slots
+        self.count = 0
+
+    def write(self, window, info):
+        record = self.records[self.count % self.slots]
+        record['samples'] = window
+        record['index'] = info.index
+        record['capture_time'] = info.capture_time
+        record['latency'] = np.nan if info.latency is None else info.latency
+        record['stream_time'] = np.nan if info.stream_time is None else info.stream_time
+        self.count += 1
+        self.header['count'] = self.count
+
+    def close(self):
+        self.records.flush()
+        del self.records
+        del self.header
+
+
+class TapReader(object):
+    '''
+    Reads a file written by WindowTap, replay() feeds its windows to a window callback, oldest first.
+    '''
+
+    def __init__(self, path):
+        header = np.memmap(path, dtype=HEADER_DTYPE, mode='r', shape=(1,))[0]
+        if header['magic'] != MAGIC:
+            raise ValueError('not a window tap file: %s' % path)
+        self.channels = int(header['channels'])
+        self.samples = int(header['samples'])
+        self.slots = int(header['slots'])
+        self.count = int(header['count'])
+        self.records = np.memmap(path, dtype=record_dtype(self.channels, self.samples), mode='r',
+                                 offset=HEADER_SIZE, shape=(self.slots,))
+
+    def __len__(self):
+        return min(self.count, self.slots)
+
+    def __iter__(self):
+        ''' yields every window still in the file together with its WindowInfo, oldest first '''
+        for i in range(self.count - len(self), self.count):
+            record = self.records[i % self.slots]
+            latency = float(record['latency'])
+            stream_time = float(record['stream_time'])
+            yield record['samples'], WindowInfo(int(record['index']), float(record['capture_time']),
+                                                None if np.isnan(latency) else latency,
+                                                None if np.isnan(stream_time) else stream_time)
+
+    def replay(self, window_callback, timing=False):
+        for window, info in self:
+            if timing:
+                window_callback(window, info)
+            else:
+                window_callback(window)
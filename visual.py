@@ -15,19 +15,13 @@ import subprocess
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
-SAMPLE_RATE = 44100  # in samples per second
+SAMPLE_RATE = 44100  # in samples per second, until the actual one is known
 WINDOW_SIZE = 1024  # in samples
 DISPLAY_WIDTH = int(subprocess.check_output(['stty', 'size']).split()[1])
 SECONDS_OF_HISTORY = 0.5
-WINDOW_RATE = float(SAMPLE_RATE) / WINDOW_SIZE  # (windows per second)
-HISTORY_LENGTH = int(SECONDS_OF_HISTORY * WINDOW_RATE)
 FADE_MILLIS = 2000  # in ms
 FADE_TIME = FADE_MILLIS / 1000.0
 HUE_SPEED = 2.0  # in color cycles per minute
-HUE_RATE = HUE_SPEED / (WINDOW_RATE * 60)
-# drop by half after 1 second:
-DROP_FACTOR = math.e ** (math.log(0.5) / (WINDOW_RATE * 1))
-DROP_FACTOR_SLOW = math.e ** (math.log(0.5) / (WINDOW_RATE * 10))
 
 COLOR_NORMAL = '\x1b[0m'
 COLOR_DARKGRAY = '\x1b[1;30m'
@@ -36,9 +30,33 @@ COLOR_BEAT = COLOR_YELLOW
 COLOR_NOBEAT = COLOR_DARKGRAY
 
 
+def analyze(samples):
+    '''
+    the part of AudioVisualizer.process() that only depends on the window itself,
+    so it can run in an AnalysisPool worker: returns the RMS of the window
+    '''
+    def mean(values):
+        try:
+            return sum(values) / len(values)
+        except ZeroDivisionError:
+            return 0
+
+    def rms(values):
+        return math.sqrt(mean(values ** 2))
+
+    return rms(samples)
+
+
 class AudioVisualizer(object):
-    def __init__(self, led_control):
+    '''
+    The rates and factors that depend on how many windows come in per second are computed per instance,
+    from window_size (the hop size, if the windows overlap) and the sample rate, see set_sample_rate().
+    '''
+
+    def __init__(self, led_control, window_size=WINDOW_SIZE, sample_rate=SAMPLE_RATE):
         self.led_control = led_control
+        self.window_size = window_size
+        self.set_sample_rate(sample_rate)
         self.windows_since_beat = 0
         self.hue = 0.0
         self.window_rms = 1.0
@@ -49,16 +67,23 @@ class AudioVisualizer(object):
         self.moving_variance = 0.0
         self.deviation = 0.0
 
+    def set_sample_rate(self, sample_rate):
+        ''' sample rate callback for PulseAudioMonitor, called whenever the stream's sample rate changes '''
+        self.window_rate = float(sample_rate) / self.window_size  # (windows per second)
+        self.history_length = int(SECONDS_OF_HISTORY * self.window_rate)
+        self.hue_rate = HUE_SPEED / (self.window_rate * 60)
+        # drop by half after 1 second:
+        self.drop_factor = math.e ** (math.log(0.5) / (self.window_rate * 1))
+        self.drop_factor_slow = math.e ** (math.log(0.5) / (self.window_rate * 10))
+
     def process(self, samples):
-        def mean(values):
-            try:
-                return sum(values) / len(values)
-            except ZeroDivisionError:
-                return 0
+        self.show(analyze(samples))
 
-        def rms(values):
-            return math.sqrt(mean(values ** 2))
+    def meter(self, peaks):
+        ''' window callback for PulseAudioMonitor's meter mode, shows the highest of the peaks '''
+        self.show(float(peaks.max()))
 
+    def show(self, window_rms):
         def scale(value, max_input=1.0, max_output=1.0):
             try:
                 return min(float(value), max_input) / max_input * max_output
@@ -74,10 +99,10 @@ class AudioVisualizer(object):
 
         # rms/beat stuff
         self.windows_since_beat += 1
-        self.rms_high *= DROP_FACTOR
-        self.rms_high_slow *= DROP_FACTOR_SLOW
+        self.rms_high *= self.drop_factor
+        self.rms_high_slow *= self.drop_factor_slow
         prev_rms = self.window_rms
-        self.window_rms = rms(samples)
+        self.window_rms = window_rms
 
         # exponentially-weighted moving mean and variance
         # http://nfs-uxsup.csx.cam.ac.uk/~fanf2/hermes/doc/antiforgery/stats.pdf
@@ -104,13 +129,13 @@ class AudioVisualizer(object):
         prev_deviation = self.deviation
         self.deviation = math.sqrt(self.moving_variance)
         if beat:
-            hue_diff = scale(beat_val, 1.0, HUE_RATE) * 10
+            hue_diff = scale(beat_val, 1.0, self.hue_rate) * 10
             self.hue = (self.hue + hue_diff) % 1.0
             self.rms_high = self.window_rms
             self.rms_high_slow = max(self.rms_high_slow, self.window_rms)
             saturation = 1.0
             self.windows_since_beat = 0
-        hue_diff = max(HUE_RATE, (self.window_rms - self.moving_mean) * 0.1)
+        hue_diff = max(self.hue_rate, (self.window_rms - self.moving_mean) * 0.1)
         light = energy_scale(beat_val)
         self.hue = (self.hue + hue_diff) % 1.0
         rgb = hls_to_rgb(self.hue % 1.0, energy_scale(self.rms_high), 1.0)
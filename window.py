@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+
+from collections import namedtuple, deque
+from threading import Condition
+import numpy as np
+import time
+import traceback
+
+
+# metadata passed along with a window in timing mode:
+# index: position of the window on the stream, in hops (consecutive windows differ by 1)
+# capture_time: time.time() at which the last sample of the window was captured
+# latency: source latency reported by PulseAudio in seconds, None if unknown
+# stream_time: stream clock at the last sample of the window in seconds, None if unknown
+WindowInfo = namedtuple('WindowInfo', 'index capture_time latency stream_time')
+
+# what WindowQueue.put() does when the queue is full
+QUEUE_POLICIES = ('drop-oldest', 'drop-newest', 'coalesce')
+
+
+def unpack_s24(data):
+    '''
+    NumPy has no 24 bit integers, so this widens packed S24LE bytes to int32 samples
+    (the 24 bits ending up in the upper bytes), at the cost of one extra copy.
+    '''
+    padded = np.zeros((len(data) // 3, 4), dtype=np.uint8)
+    padded[:, 1:] = data.reshape(-1, 3)
+    return padded.view('<i4')[:, 0]
+
+
+class SampleRing(object):
+    '''
+    Fixed-capacity float32 sample buffer between the capture fragments and the windows.
+
+    Samples are stored planar, i.e. with shape (channels, samples), or just (samples,)
+    for a single channel. write() takes interleaved frames of shape (frames, channels)
+    and deinterleaves them (and scales integer samples to float) while copying them
+    into the buffer exactly once, fill() appends silence. peek() hands out the
+    oldest pending samples as a view. A view stays valid until the next write().
+    The backing array is twice the capacity, so pending samples only have to be
+    moved back to the front once every capacity samples, never once per window.
+    If more than capacity samples are pending, the oldest ones are overwritten.
+    '''
+
+    def __init__(self, capacity, channels=1):
+        self.capacity = capacity
+        shape = (2 * capacity,) if channels == 1 else (channels, 2 * capacity)
+        self.buffer = np.zeros(shape, dtype=np.float32)
+        self.start = 0
+        self.end = 0
+        self.overwritten = 0
+
+    def __len__(self):
+        return self.end - self.start
+
+    def clear(self):
+        self.start = self.end = 0
+
+    def write(self, frames, scale=None):
+        target = self.append(len(frames))
+        # only the newest frames fit if there are more than capacity
+        frames = frames[len(frames) - target.shape[-1]:]
+        # (frames, channels) -> (channels, frames), or just (frames,) for a single channel
+        source = frames.T.reshape(target.shape)
+        if scale is None:
+            target[...] = source
+        else:
+            np.multiply(source, scale, out=target, dtype=np.float32, casting='unsafe')
+
+    def fill(self, n, value=0.0):
+        self.append(n)[...] = value
+
+    def append(self, n):
+        '''
+        makes room for n more samples and returns the part of the buffer they go to
+        '''
+        if n > self.capacity:
+            self.overwritten += n - self.capacity
+            n = self.capacity
+        excess = len(self) + n - self.capacity
+        if excess > 0:
+            self.overwritten += excess
+            self.start += excess
+        if self.end + n > self.buffer.shape[-1]:
+            # move the pending samples back to the front (numpy handles the overlap)
+            pending = len(self)
+            self.buffer[..., :pending] = self.buffer[..., self.start:self.end]
+            self.start = 0
+            self.end = pending
+        self.end += n
+        return self.buffer[..., self.end - n:self.end]
+
+    def peek(self, n):
+        return self.buffer[..., self.start:self.start + min(n, len(self))]
+
+    def consume(self, n):
+        self.start += min(n, len(self))
+        if self.start == self.end:
+            self.start = self.end = 0
+
+
+class WindowFramer(object):
+    '''
+    Cuts a continuous sample stream into windows of exactly window_size samples.
+
+    Successive windows start hop_size samples apart, so a hop_size smaller than
+    window_size yields overlapping windows (e.g. 1024/512). If the consumer falls
+    behind by more than max_pending windows, the oldest ones are dropped to keep
+    the latency bounded. Emitted and dropped windows are counted.
+    With more than one channel, windows have the shape (channels, window_size).
+    position is the index of the oldest pending sample since the framer was created.
+    '''
+
+    def __init__(self, window_size, hop_size=None, max_pending=8, channels=1):
+        self.window_size = window_size
+        self.hop_size = hop_size or window_size
+        self.max_pending = max_pending
+        # room for the pending windows plus a few more while the next fragments come in
+        self.ring = SampleRing(window_size + (max_pending + 4) * self.hop_size, channels)
+        self.position = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.rate_time = None
+        self.rate_counts = (0, 0)
+
+    def clear(self):
+        self.position += len(self.ring)
+        self.ring.clear()
+
+    def window_index(self):
+        ''' index of the window that starts at the oldest pending sample '''
+        return self.position // self.hop_size
+
+    def samples_behind(self):
+        ''' number of samples that came in after the end of the oldest pending window '''
+        return len(self.ring) - self.window_size
+
+    def pending(self):
+        ''' number of complete windows that can be emitted right now '''
+        available = len(self.ring) - self.window_size
+        return available // self.hop_size + 1 if available >= 0 else 0
+
+    def write(self, frames, scale=None):
+        overwritten = self.ring.overwritten
+        self.ring.write(frames, scale)
+        self.count_overwritten(self.ring.overwritten - overwritten)
+
+    def fill(self, n):
+        ''' appends n samples of silence, e.g. to keep the timeline continuous across a hole '''
+        overwritten = self.ring.overwritten
+        self.ring.fill(n)
+        self.count_overwritten(self.ring.overwritten - overwritten)
+
+    def count_overwritten(self, overwritten):
+        if overwritten:
+            self.position += overwritten
+            self.dropped += -(-overwritten // self.hop_size)
+
+    def drop_excess(self):
+        ''' drops the oldest windows if more than max_pending are pending '''
+        excess = self.pending() - self.max_pending
+        if excess > 0:
+            self.consume(excess * self.hop_size)
+            self.dropped += excess
+
+    def windows(self):
+        '''
+        yields every complete window, each one a view into the ring
+        that is only valid until the generator is resumed
+        '''
+        self.drop_excess()
+        while len(self.ring) >= self.window_size:
+            yield self.ring.peek(self.window_size)
+            self.consume(self.hop_size)
+            self.emitted += 1
+
+    def batch(self):
+        '''
+        returns every complete window at once as an array of shape (windows, window_size)
+        (or (windows, channels, window_size)), or None if there is none. The array is a view
+        into the ring (overlapping windows share their samples) that is only valid until the next write.
+        It is read-only for that reason, copy it to change it in place (e.g. to apply a window function).
+        '''
+        self.drop_excess()
+        n = self.pending()
+        if n == 0:
+            return None
+        samples = self.ring.peek((n - 1) * self.hop_size + self.window_size)
+        shape = (n,) + samples.shape[:-1] + (self.window_size,)
+        strides = (self.hop_size * samples.strides[-1],) + samples.strides
+        self.consume(n * self.hop_size)
+        self.emitted += n
+        return np.lib.stride_tricks.as_strided(samples, shape, strides, writeable=False)
+
+    def consume(self, n):
+        self.position += n
+        self.ring.consume(n)
+
+    def rates(self, now, interval=1):
+        '''
+        returns the emitted and dropped windows per second since the previous call,
+        or None if that was less than interval seconds ago
+        '''
+        if self.rate_time is None:
+            self.rate_time = now
+            self.rate_counts = (self.emitted, self.dropped)
+            return None
+        elapsed = now - self.rate_time
+        if elapsed < interval:
+            return None
+        emitted, dropped = self.rate_counts
+        self.rate_time = now
+        self.rate_counts = (self.emitted, self.dropped)
+        return (self.emitted - emitted) / elapsed, (self.dropped - dropped) / elapsed
+
+
+class WindowSource(object):
+    '''
+    Base class of the sources that stand in for PulseAudioMonitor (FileSource, SynthSource):
+    they write blocks of block_windows hops to self.framer and call deliver_windows() after each one,
+    which passes the windows to the window callback the way PulseAudioMonitor does.
+    Subclasses set self.sample_rate, and config['hop_size'] before calling __init__.
+    '''
+
+    def __init__(self, config, channels, block_windows):
+        self.config = config
+        self.should_stop = False
+        hop_size = config['hop_size']
+        max_pending = block_windows + -(-config['samples_per_window'] // hop_size)
+        self.framer = WindowFramer(config['samples_per_window'], hop_size, max_pending, channels)
+
+    def deliver_windows(self, start_time, speed=None):
+        '''
+        delivers every complete window, at speed times the pace the samples were recorded at
+        (None for as fast as the window callback allows), start_time being time.time() at the first sample
+        '''
+        timing = self.config.get('timing')
+        for window in self.framer.windows():
+            # the end of the window, relative to the first sample
+            end = float(self.framer.position + self.framer.window_size) / self.sample_rate
+            if speed:
+                delay = start_time + end / speed - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+            args = (window,)
+            if timing:
+                args += (WindowInfo(self.framer.window_index(), start_time + end, 0.0, end),)
+            try:
+                self.config['window_callback'](*args)
+            except:
+                traceback.print_exc()
+                self.stop()
+            if self.should_stop:
+                break
+
+    def stop(self):
+        self.should_stop = True
+
+
+class WindowQueue(object):
+    '''
+    Bounded hand-off of windows from one producer thread to one consumer thread.
+
+    The windows are copied into size + 1 preallocated slots, size of them queued and one
+    held by the consumer until its next get(), so nothing is allocated per window.
+    The lock only guards the bookkeeping, never a copy or the consumer's work.
+    policy decides which windows put() gives up:
+    - 'drop-oldest': the oldest queued window when the queue is full, so the consumer catches up to fresh data
+    - 'drop-newest': the window being put when the queue is full, so the consumer sees an unbroken run of older ones
+    - 'coalesce': every window still queued, always, so at most the latest one is waiting for the consumer
+    Dropped windows are counted, as is the deepest the queue has been (max_depth).
+    A window may be shorter than shape along its first axis (e.g. a batch of fewer windows),
+    get() returns just the part that was put.
+    '''
+
+    def __init__(self, size, shape, policy='drop-oldest'):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError('unknown queue policy: %s' % policy)
+        self.size = size
+        self.policy = policy
+        self.slots = np.zeros((size + 1,) + tuple(shape), dtype=np.float32)
+        self.extras = [None] * (size + 1)
+        self.lengths = [0] * (size + 1)
+        self.free = list(range(size + 1))
+        self.queued = deque()
+        self.busy = None
+        self.closed = False
+        self.condition = Condition()
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        ''' queue depth, i.e. number of windows waiting for the consumer '''
+        return len(self.queued)
+
+    def put(self, window, extra=None):
+        '''
+        copies window into the queue, extra is handed back along with it,
+        returns False if the window itself was dropped
+        '''
+        with self.condition:
+            if self.policy == 'coalesce':
+                self.free.extend(self.queued)
+                self.dropped += len(self.queued)
+                self.queued.clear()
+            elif len(self.queued) == self.size:
+                if self.policy == 'drop-newest':
+                    self.dropped += 1
+                    return False
+                self.free.append(self.queued.popleft())
+                self.dropped += 1
+            slot = self.free.pop()
+        # the slot is neither free nor queued, so nobody else touches it meanwhile
+        self.slots[slot][:len(window)] = window
+        self.extras[slot] = extra
+        self.lengths[slot] = len(window)
+        with self.condition:
+            self.queued.append(slot)
+            self.max_depth = max(self.max_depth, len(self.queued))
+            self.condition.notify()
+        return True
+
+    def get(self):
+        '''
+        blocks until a window is queued and returns it with its extra, or None once the queue
+        is closed and empty. The window stays valid until the next call.
+        '''
+        with self.condition:
+            if self.busy is not None:
+                self.free.append(self.busy)
+                self.busy = None
+            while not self.queued and not self.closed:
+                self.condition.wait()
+            if not self.queued:
+                return None
+            self.busy = self.queued.popleft()
+        return self.slots[self.busy][:self.lengths[self.busy]], self.extras[self.busy]
+
+    def close(self):
+        ''' lets the consumer drain what is queued, get() returns None after that '''
+        with self.condition:
+            self.closed = True
+            self.condition.notify()